@@ -65,7 +65,17 @@
 #   <optgroup>.channel
 #   <optgroup>.nick_display_max_length
 #   <optgroup>.regex
+#   <optgroup>.regex_engine
 #   <optgroup>.server
+#   <optgroup>.text_prefixes
+#
+# 'text_prefixes' is optional. It's a comma separated list of literal strings,
+# one of which the text of a message must start with (ignoring any leading
+# "\x01ACTION ", see 'Action Messages' below) before the regex is applied. 
+# Messages from the bot which don't start with any of them, such as the bot's 
+# own status messages, are passed over without running the regex. As with 
+# bot_nicks, whitespace at the beginning and end of each prefix is ignored, EG:
+#  /set plugins.var.python.format_bridge_bot_output.MyGroup.text_prefixes (slack),(discord)
 #
 # Options can be added and removed using WeeChat's '/set' and '/unset' commands,
 # EG: 
@@ -115,8 +125,83 @@
 # brackets: [\x01].
 #
 ################################################################################
+# Regex Engine:
+#
+# By default regexes are matched using Python's 're' module, which is a
+# backtracking engine. A poorly written regex (EG one containing nested 
+# quantifiers) can take a very long time to fail against a long message.
+#
+# Alternatively, a group can use Google's RE2 library, which matches in time
+# proportional to the length of the message. This requires the Python bindings
+# for RE2 (the 're2' module, EG 'pip install google-re2') and is enabled per 
+# group using the optional 'regex_engine' option, EG:
+#  /set plugins.var.python.format_bridge_bot_output.MyGroup.regex_engine re2
+#
+# Valid values are 're' (the default, used if the option is not set) and 
+# 're2'. If 're2' is specified but the module can't be imported, or RE2 doesn't
+# support the regex (EG it contains backreferences or lookarounds), then an
+# error is logged to the WeeChat core buffer and 're' is used instead.
+#
+# NB: RE2 doesn't match exactly the same way as 're'. In particular \w, \d, \s
+# and \b only match ASCII characters in RE2 whereas in Python 3's 're' they
+# match unicode characters. EG '<(?P<nick>\w+)>' matches '<Zoë>' using 're' but
+# not using RE2, in which case the message is unaltered. If using RE2 with 
+# nicks containing non-ASCII characters, prefer a negated character class such
+# as '<(?P<nick>[^>]+)>'.
+#
+################################################################################
 # Change Log:
 #
+# 0.6.0 - 2026-10-14
+#   * Each group's regex is now compiled when the script is loaded or the
+#     group's options are changed, rather than for every message received.
+#     An invalid regex is reported in the WeeChat core buffer (once, when it is
+#     set) and the group is ignored until the regex is corrected.
+#   * The server, channel and bot_nicks of each group are stripped of leading
+#     and trailing whitespace when the config is parsed rather than for every
+#     message received.
+#   * Groups are indexed by server and channel so that a message is only
+#     checked against the groups for the server and channel on which it was
+#     received.
+#   * Messages received from a server for which there are no groups are no
+#     longer parsed.
+#   * The zero-width space and ellipsis characters are now module level
+#     constants.
+#   * Whitespace is removed from nicks using a translation table rather than
+#     splitting and joining the nick.
+#   * The namedtuple used to store a group's options is now created once when
+#     the script is loaded rather than each time the config is parsed.
+#   * Fixed a TypeError in '<SCRIPT_NAME>_remove-group-options' when the wrong
+#     number of arguments is supplied; an integer was being concatenated to a
+#     string in the error message.
+#   * Zero-width spaces and whitespace are now removed from a nick in a single
+#     pass before it is truncated, so 'nick_display_max_length' no longer
+#     counts whitespace that would have been removed afterwards.
+#   * Added an optional group option, 'regex_engine'. If set to 're2' (and the
+#     're2' module is installed) the group's regex is compiled using RE2 rather
+#     than 're', see 'Regex Engine' above for the differences between the two.
+#     The default remains 're'.
+#   * Added an optional group option, 'text_prefixes'. If set, the regex is
+#     only applied to messages which start with one of the prefixes.
+#   * 'nick_display_max_length' is converted to an integer when the config is
+#     parsed. An invalid value is reported in the WeeChat core buffer (once,
+#     when it is set) and nicks are not truncated, rather than raising an
+#     error for every message received.
+#   * Fixed the sender's nick being substituted into the user and host parts
+#     of a message's prefix when they contain the bot's nick.
+#   * Groups with an empty or invalid regex are no longer checked when a 
+#     message is received. Previously such a group could still cause the 
+#     "More than one script option matched" error.
+#   * Groups are stored in a dictionary keyed by group name, so a change to a
+#     group's options replaces its entry rather than rebuilding the list of
+#     groups.
+#   * When a group's options are changed, the index of groups by server and
+#     channel is rebuilt once shortly afterwards rather than for every option
+#     changed.
+#   * Messages without a channel or nick are returned unaltered straight after
+#     being parsed.
+#   * The altered message is built by concatenation rather than 'str.format'.
+#
 # 0.5.1 - 2019-12-01 - Adam Russell
 #   * Replaced all usage of '<>' as a not equal operator with '!=' because the
 #     former isn't supported in Python 3 whereas the latter is supported in both
@@ -186,61 +271,207 @@
 ################################################################################
 
 import weechat as w
+import collections
 import re
 import sys
 
+# RE2 is optional and only used by groups whose 'regex_engine' option is 're2',
+# see 'Regex Engine' above.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 SCRIPT_NAME = "format_bridge_bot_output"
 SCRIPT_AUTHOR = "Adam Russell (https://www.thecliguy.co.uk)"
 SCRIPT_DESC = "Formats messages received from a bridge bot to appear as though they came from an IRC user."
 SETTINGS_PREFIX = "plugins.var.python.{}.".format(SCRIPT_NAME)
-SCRIPT_VERSION = "0.5.1"
+SCRIPT_VERSION = "0.6.0"
 SCRIPT_LICENSE = "GPLv3"
 
+# NB: Evaluated once when the script is loaded. The only per-message use of
+# this is the decoding and encoding of the nick in msg_cb.
 PY2 = sys.version_info < (3,)
 
-settings_lst = []
+# NB: These are unicode in both Python 2 and 3 because msg_cb decodes the nick
+# before they're applied to it (and encodes it afterwards).
+ZWSP = u'\u200b'
+ELLIPSIS = u'\u2026'
+
+# The start of the 'text' element of an action message, see 'Action Messages'
+# above.
+ACTION_PREFIX = "\x01ACTION "
+
+# A translation table which removes zero-width spaces and every character that
+# 'split()' treats as whitespace (all of which lie at or below U+3000, the 
+# ideographic space) from a nick in a single pass.
+NICK_STRIP_TABLE = dict.fromkeys(c for c in range(0x3001) if (u'%c' % c).isspace())
+NICK_STRIP_TABLE[ord(ZWSP)] = None
+
+SettingsTuple = collections.namedtuple('SettingsTuple', 'name server channel bot_nicks nick_display_max_length regex regex_engine compiled_regex server_norm channel_norm bot_nicks_set text_prefixes text_prefixes_tuple nick_max_length')
+
+# Groups keyed by group name.
+settings_map = {}
+
+# Groups keyed by (server, channel), rebuilt whenever settings_map changes so
+# that msg_cb doesn't have to scan every group for every message received.
+settings_index = {}
+
+# The servers for which at least one group exists.
+configured_servers = set()
+
+# Whether a timer has been hooked to rebuild settings_index, see config_cb.
+rebuild_pending = False
+
+# How long (in milliseconds) config_cb waits before rebuilding settings_index.
+REBUILD_DELAY_MS = 50
+
+
+def compile_regex(GroupName, regex, regex_engine):
+    # An empty regex denotes an incomplete group, in which case there is
+    # nothing to compile.
+    if not regex:
+        return None
+    
+    # An empty 'regex_engine' means the default, 're'.
+    regex_engine = (regex_engine or "re").strip()
+    
+    if regex_engine == "re2":
+        if re2 is None:
+            w.prnt("", w.prefix("error") + SCRIPT_NAME + ": Group '" + GroupName + "' has regex_engine 're2' but the 're2' module could not be imported. Using 're' instead.")
+        else:
+            # If the regex uses a feature which RE2 doesn't support (EG 
+            # backreferences or lookarounds) then fall back to 're'.
+            try:
+                return re2.compile(regex)
+            except re2.error as e:
+                w.prnt("", w.prefix("error") + SCRIPT_NAME + ": RE2 could not compile the regex for group '" + GroupName + "': " + str(e) + ". Using 're' instead.")
+    elif regex_engine != "re":
+        w.prnt("", w.prefix("error") + SCRIPT_NAME + ": Invalid regex_engine for group '" + GroupName + "': " + regex_engine + ". Using 're' instead.")
+    
+    try:
+        return re.compile(regex)
+    except re.error as e:
+        w.prnt("", w.prefix("error") + SCRIPT_NAME + ": Invalid regex for group '" + GroupName + "': " + str(e))
+        return None
+
+
+def parse_nick_max_length(GroupName, nick_display_max_length):
+    # NB: Weechat stores all script options as strings. Therefore we need to
+    # convert 'nick_display_max_length' to an integer. An empty value means
+    # that nicks aren't truncated.
+    if not nick_display_max_length:
+        return 0
+    
+    try:
+        return int(nick_display_max_length)
+    except ValueError:
+        w.prnt("", w.prefix("error") + SCRIPT_NAME + ": Invalid nick_display_max_length for group '" + GroupName + "': " + nick_display_max_length + ". Nicks will not be truncated.")
+        return 0
+
+
+def build_settings_index():
+    index = {}
+    
+    for item in settings_map.values():
+        # A group without a (valid) regex can't match anything, so it's left
+        # out of the index. It remains in settings_map for print_debug.
+        if item.compiled_regex is None:
+            continue
+        
+        index.setdefault((item.server_norm, item.channel_norm), []).append(item)
+    
+    # Replace the contents of the existing dictionary object.
+    settings_index.clear()
+    settings_index.update(index)
+    
+    configured_servers.clear()
+    configured_servers.update(server for (server, channel) in index)
+
+
+def rebuild_settings_index_cb(data, remaining_calls):
+    global rebuild_pending
+    rebuild_pending = False
+    
+    build_settings_index()
+    
+    return w.WEECHAT_RC_OK
+
+
+def get_group_settings(GroupName, previous=None):
+    # 'previous' is the group's existing entry in settings_map (if any). Its
+    # compiled regex and integer nick length are reused when the corresponding
+    # options haven't changed, so that setting one of the group's other options
+    # doesn't recompile or reparse them (or repeat an error about them).
+    server = w.config_get_plugin(GroupName + ".server")
+    channel = w.config_get_plugin(GroupName + ".channel")
+    bot_nicks = w.config_get_plugin(GroupName + ".bot_nicks")
+    nick_display_max_length = w.config_get_plugin(GroupName + ".nick_display_max_length")
+    regex = w.config_get_plugin(GroupName + ".regex")
+    regex_engine = w.config_get_plugin(GroupName + ".regex_engine")
+    text_prefixes = w.config_get_plugin(GroupName + ".text_prefixes")
+    
+    if previous is not None and previous.regex == regex and previous.regex_engine == regex_engine:
+        compiled_regex = previous.compiled_regex
+    else:
+        compiled_regex = compile_regex(GroupName, regex, regex_engine)
+    
+    if previous is not None and previous.nick_display_max_length == nick_display_max_length:
+        nick_max_length = previous.nick_max_length
+    else:
+        nick_max_length = parse_nick_max_length(GroupName, nick_display_max_length)
+    
+    return SettingsTuple(
+        name = GroupName, 
+        server = server, 
+        channel = channel,
+        bot_nicks = bot_nicks,
+        nick_display_max_length = nick_display_max_length,
+        regex = regex,
+        regex_engine = regex_engine,
+        compiled_regex = compiled_regex,
+        server_norm = (server or "").strip(),
+        channel_norm = (channel or "").strip(),
+        bot_nicks_set = frozenset(bot_nick.strip() for bot_nick in (bot_nicks or "").split(",")),
+        text_prefixes = text_prefixes,
+        # NB: str.startswith accepts a tuple, an empty tuple means no pre-filter.
+        # Whitespace at the beginning and end of each prefix is stripped, as
+        # for bot_nicks.
+        text_prefixes_tuple = tuple(prefix.strip() for prefix in (text_prefixes or "").split(",") if prefix.strip()),
+        nick_max_length = nick_max_length
+    )
+
 
 def parse_config():   
-    # Clear settings_lst
-    del settings_lst[:]
+    # Clear settings_map
+    settings_map.clear()
     
     infolist = w.infolist_get("option", "", SETTINGS_PREFIX + "*")
     
-    optiongroups_lst = []
+    # Unique option group names
+    optiongroups = set()
     
     if infolist:
         while w.infolist_next(infolist):
             name = w.infolist_string(infolist, "option_name")
             name = name.replace("python." + SCRIPT_NAME + ".", "")
             GroupName = name.split(".")[0]
-            optiongroups_lst.append(GroupName)
+            optiongroups.add(GroupName)
                               
     w.infolist_free(infolist)
     
-    # Get unique option group names
-    optiongroups_lst = list(set(optiongroups_lst))
-    
-    import collections
-    
-    for GroupName in optiongroups_lst:
-        settings_namedtuple = collections.namedtuple('settings_namedtuple', 'name server channel bot_nicks nick_display_max_length regex')
-                    
-        obj = settings_namedtuple(
-            name = GroupName, 
-            server = w.config_get_plugin(GroupName + ".server"), 
-            channel = w.config_get_plugin(GroupName + ".channel"),
-            bot_nicks = w.config_get_plugin(GroupName + ".bot_nicks"),
-            nick_display_max_length = w.config_get_plugin(GroupName + ".nick_display_max_length"),
-            regex = w.config_get_plugin(GroupName + ".regex")
-        )     
-        
-        settings_lst.append(obj)
+    for GroupName in optiongroups:
+        settings_map[GroupName] = get_group_settings(GroupName)
     
-    ####for x in settings_lst:
+    build_settings_index()
+    
+    ####for x in settings_map.values():
     ####    w.prnt("", "ZZZ: " + str(x))
 
 
 def config_cb(data, option, value):
+    global rebuild_pending
+    
     #### w.prnt("", "config_cb")
     #### w.prnt("", "data: " + data)
     #### w.prnt("", "option: " + option)
@@ -252,33 +483,23 @@ def config_cb(data, option, value):
     GroupName = GroupNameAndOptionName.split(".")[0]
     OptionName = GroupNameAndOptionName.split(".")[1]
     
-    # Prevent a duplicate option group from being added to the settings list.
-    # Use list comprehension to filter out tuples where the name matches the
-    # option group name.
-    tmplist = [item for item in settings_lst if item.name != GroupName]
-    
-    import collections
-    
-    settings_namedtuple = collections.namedtuple('settings_namedtuple', 'name server channel bot_nicks nick_display_max_length regex')
-    
-    obj = settings_namedtuple(
-        name = GroupName, 
-        server = w.config_get_plugin(GroupName + ".server"), 
-        channel = w.config_get_plugin(GroupName + ".channel"),
-        bot_nicks = w.config_get_plugin(GroupName + ".bot_nicks"),
-        nick_display_max_length = w.config_get_plugin(GroupName + ".nick_display_max_length"),
-        regex = w.config_get_plugin(GroupName + ".regex")
-    )
+    obj = get_group_settings(GroupName, settings_map.get(GroupName))
 
-    # If all obj properties are null/empty then don't bother adding to the list
+    # Since settings_map is keyed by group name, a group's existing entry is 
+    # simply replaced. If all obj properties are null/empty (EG the group's 
+    # options have been unset) then remove the group instead.
     if not obj.server and not obj.channel and not obj.bot_nicks and not obj.regex:
-        pass
+        settings_map.pop(GroupName, None)
     else:
-        tmplist.append(obj)
+        settings_map[GroupName] = obj
     
-    # Replace all elements in the existing settings list object.
-    # https://stackoverflow.com/questions/26233935/what-is-the-correct-way-to-reassign-a-list-in-python
-    settings_lst[:] = tmplist
+    # Adding a group typically involves setting several options in quick 
+    # succession (EG using '<SCRIPT_NAME>_add-server-channel-botnicks-nicklength'),
+    # each of which calls config_cb. Rather than rebuilding settings_index for
+    # every one of them, a single rebuild is scheduled shortly afterwards.
+    if not rebuild_pending:
+        rebuild_pending = True
+        w.hook_timer(REBUILD_DELAY_MS, 0, 1, "rebuild_settings_index_cb", "")
     
     ####w.prnt("", "Group Name: " + GroupName + ", Option Name: " + OptionName + ", Value: " + value)
     
@@ -360,7 +581,7 @@ def remove_group_options(data, buffer, argList):
         
     if num_of_args != intRequiredArgs:
         #print_help()
-        w.prnt("", w.prefix("error") + "Wrong number of arguments. Supplied: " + str(num_of_args) + ", required: " + intRequiredArgs + ".")
+        w.prnt("", w.prefix("error") + "Wrong number of arguments. Supplied: " + str(num_of_args) + ", required: " + str(intRequiredArgs) + ".")
         return w.WEECHAT_RC_ERROR
     
     GroupName = split_args[0]
@@ -386,8 +607,8 @@ def remove_group_options(data, buffer, argList):
 
 
 def print_debug(data, buffer, argList):
-    # Output the contents of the list.
-    for x in settings_lst:
+    # Output the contents of the dictionary.
+    for x in settings_map.values():
         w.prnt("", "----------------------------------------------------------")
         w.prnt("", "Options Group Name: " + str(x.name))
         w.prnt("", "  * server: " + str(x.server))
@@ -395,6 +616,8 @@ def print_debug(data, buffer, argList):
         w.prnt("", "  * bot_nicks: " + str(x.bot_nicks))
         w.prnt("", "  * nick_display_max_length: " + str(x.nick_display_max_length))
         w.prnt("", "  * regex: " + str(x.regex))
+        w.prnt("", "  * regex_engine: " + str(x.regex_engine))
+        w.prnt("", "  * text_prefixes: " + str(x.text_prefixes))
      
     w.prnt("", "----------------------------------------------------------")
      
@@ -402,37 +625,54 @@ def print_debug(data, buffer, argList):
     
 
 def msg_cb(data, modifier, modifier_data, string):
-    parsed = w.info_get_hashtable("irc_message_parse", {'message': string})
-        
-    # Filter using list comprehension.
     # NB: modifier_data contains the server name.
     #
-    # 07/11/18: Whitespace at the beginning and end of a nick within 
-    # bot_nicks is stripped, used this as a reference: 
-    # https://python-forum.io/Thread-Best-way-to-strip-after-split
-    result = [item for item in settings_lst if item.server.strip() == modifier_data and item.channel.strip() == parsed['channel'] and parsed['nick'] in [s.strip() for s in item.bot_nicks.split(',')]]
+    # If there are no groups for the server then there's no need to parse the
+    # message.
+    if modifier_data not in configured_servers:
+        return string
+    
+    parsed = w.info_get_hashtable("irc_message_parse", {'message': string})
+    
+    # A message without a channel or nick (EG one sent by the server itself)
+    # can't have been relayed by a bridge bot.
+    channel = parsed.get('channel')
+    bot = parsed.get('nick')
+    if not channel or not bot:
+        return string
+        
+    # Get the groups for the server and channel on which the message was 
+    # received (most messages won't have any), then filter them by the nick of
+    # the sender.
+    candidates = settings_index.get((modifier_data, channel))
+    if candidates is None:
+        return string
+    
+    result = [item for item in candidates if bot in item.bot_nicks_set]
     
     resultcount = len(result)
     if resultcount == 0:
         return string
     elif resultcount > 1:
-        w.prnt("", w.prefix("error") + SCRIPT_NAME + ": More than one script option matched the following; server=" + modifier_data + ", channel=" + parsed['channel'] + ", nick=" + parsed['nick'] + ". Result count: " + str(resultcount) + ". Results: " + str(result))
+        w.prnt("", w.prefix("error") + SCRIPT_NAME + ": More than one script option matched the following; server=" + modifier_data + ", channel=" + channel + ", nick=" + bot + ". Result count: " + str(resultcount) + ". Results: " + str(result))
         return string    
     
-    bot = parsed['nick']
+    res = result[0]
     
-    for res in result:
-        regularexp = re.compile(res.regex)
-        # NB: Weechat stores all script options as strings. Therefore we need to
-        # convert 'nick_display_max_length' to an integer.
-        if res.nick_display_max_length:
-            intNickMaxLength = int(res.nick_display_max_length)
-        else:
-            intNickMaxLength = 0
+    # NB: The regex is compiled and 'nick_display_max_length' is converted to
+    # an integer when the config is parsed rather than for every message
+    # received.
+    regularexp = res.compiled_regex
+    intNickMaxLength = res.nick_max_length
  
-    # If the value of the regex is an empty string then skip it.
-    if not regularexp.pattern:
-        return string
+    # If the group has any text prefixes then don't bother applying the regex
+    # to a message that doesn't start with one of them.
+    if res.text_prefixes_tuple:
+        body = parsed['text']
+        if body.startswith(ACTION_PREFIX):
+            body = body[len(ACTION_PREFIX):]
+        if not body.startswith(res.text_prefixes_tuple):
+            return string
     
     m = regularexp.match(parsed['text'])
     if not m:
@@ -451,9 +691,8 @@ def msg_cb(data, modifier, modifier_data, string):
 
     # If Python 2 then decode the nick (unless it's already a unicode object,
     # which I don't think should ever be the case).
-    if PY2:
-        if type(nick) is not unicode:
-            nick = nick.decode('utf-8')
+    if PY2 and type(nick) is not unicode:
+        nick = nick.decode('utf-8')
     
     ####w.prnt("", repr(type(nick)))
     
@@ -470,8 +709,17 @@ def msg_cb(data, modifier, modifier_data, string):
     #
     # In a future version I may make this a configurable option rather than
     # having it hard-coded.    
-    ZeroWidthSpace = u'\u200b'
-    nick = nick.replace(ZeroWidthSpace, "")
+    #
+    # A nick cannot contain a space. If it does then Weechat appears to 
+    # treat what follows the space as a "command", this appears in the 
+    # channel's 'server buffer'. EG the following is from a Slack user 
+    # with a space is his name called 'Barry Rocks' (IP address obfuscated):
+    #    20:00:00 =!= | irc: command "Rocks!~Barry" not found:
+    #    20:00:00 =!= | :Barry Rocks!~Barry Rocks@1.2.3.4 PRIVMSG #foobar [slack]  Test message.    
+    #
+    # Zero-width spaces and whitespace are both removed by the same
+    # translation table, before the nick is truncated.
+    nick = nick.translate(NICK_STRIP_TABLE)
     
     # The width of Weechat's 'prefix line' dynamically expands to accommodate
     # the longest item within it. The more space that is occupied by the prefix 
@@ -492,29 +740,26 @@ def msg_cb(data, modifier, modifier_data, string):
         nickformatted = nick
     else:
         if len(nick) > intNickMaxLength:    
-            ellipsis = u'\u2026'
-            nickformatted = nick[0:intNickMaxLength] + ellipsis
+            nickformatted = nick[0:intNickMaxLength] + ELLIPSIS
         else:
             nickformatted = nick
-    
-    # A nick cannot contain a space. If it does then Weechat appears to 
-    # treat what follows the space as a "command", this appears in the 
-    # channel's 'server buffer'. EG the following is from a Slack user 
-    # with a space is his name called 'Barry Rocks' (IP address obfuscated):
-    #    20:00:00 =!= | irc: command "Rocks!~Barry" not found:
-    #    20:00:00 =!= | :Barry Rocks!~Barry Rocks@1.2.3.4 PRIVMSG #foobar [slack]  Test message.    
-    nickformatted = ''.join(nickformatted.split())
 
     # If Python 2 then encode the nick.
-    if PY2:
-        if type(nickformatted) is unicode:
-            nickformatted = nickformatted.encode('utf-8')
+    if PY2 and type(nickformatted) is unicode:
+        nickformatted = nickformatted.encode('utf-8')
     
     text = action + "[" + network + "] " + text
-    parsed['text'] = text
-    parsed['host'] = parsed['host'].replace(bot, nickformatted)
-        
-    return ":{host} {command} {channel} {text}".format(**parsed)
+    
+    # The host is in the form 'nick!user@host'. Replace the bot's nick at the
+    # start of it with the sender's nick (replacing every occurrence of the
+    # bot's nick would also alter the user or host if they contain it).
+    host = parsed['host']
+    bang = host.find('!')
+    host = nickformatted + (host[bang:] if bang >= 0 else '')
+    
+    # Equivalent to ":{host} {command} {channel} {text}".format(...) but 
+    # without the overhead of parsing the format string for every message.
+    return ":" + host + " " + parsed['command'] + " " + channel + " " + text
 
 
 if __name__ == '__main__':